@@ -27,7 +27,10 @@ class NotTooLongStringFormatter(logging.Formatter):
                 "FUNCNODES_LOG_MAX_FORMAT_LENGTH", DEFAULT_MAX_FORMAT_LENGTH
             )
         super(NotTooLongStringFormatter, self).__init__(*args, **kwargs)
-        self.max_length = max(max_length - 3, 0)
+        # the environment variable provides the length as a string
+        self.max_length = max(int(max_length), 0)
+        # truncated messages keep this many characters, followed by "..."
+        self._truncate_at = max(self.max_length - 3, 0)
 
     def format(self, record):
         """
@@ -42,12 +45,9 @@ class NotTooLongStringFormatter(logging.Formatter):
         s = super().format(record)
 
         # Do not truncate if there's exception information (traceback)
-        if record.exc_info:
+        if record.exc_info or len(s) <= self.max_length:
             return s
-
-        if len(s) > self.max_length:
-            s = s[: self.max_length] + "..."
-        return s
+        return s[: self._truncate_at] + "..."
 
 
 _formatter = NotTooLongStringFormatter(
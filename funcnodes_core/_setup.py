@@ -1,22 +1,19 @@
 from typing import Dict, Optional
-import gc
 from .config import update_render_options
 from .lib import check_shelf
 from ._logging import FUNCNODES_LOGGER
-from .utils.plugins import get_installed_modules, InstalledModule
+from .utils.plugins import get_installed_modules
+from .utils.plugins_types import InstalledModule, ReactPlugin  # noqa: F401
 
 try:
-    from funcnodes_react_flow import add_react_plugin, ReactPlugin
+    from funcnodes_react_flow import add_react_plugin
 except (ModuleNotFoundError, ImportError):
 
     def add_react_plugin(*args, **kwargs):
         pass
 
-    ReactPlugin = dict
-
 
 def setup_module(mod_data: InstalledModule) -> Optional[InstalledModule]:
-    gc.collect()
     entry_points = mod_data.entry_points
     mod = mod_data.module
     if not mod:
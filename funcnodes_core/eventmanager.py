@@ -30,11 +30,10 @@ class AsyncEventManager:
         Args:
             obj (Any): The object that owns this EventManager instance.
         """
+        # the event dictionary is only accessed from the event loop and never across an await,
+        # so no lock is needed to keep it consistent
         self._async_events: Dict[str, asyncio.Event] = {}
         self._obj = weakref.ref(obj)
-        self._lock = (
-            asyncio.Lock()
-        )  # Lock to ensure thread-safe access to the _async_events dictionary.
 
     @property
     def obj(self) -> Any:
@@ -46,6 +45,21 @@ class AsyncEventManager:
         """
         return self._obj()
 
+    def _get_event(self, event: str) -> asyncio.Event:
+        """
+        Returns the event with the given name, creating it if it does not exist yet.
+
+        Args:
+            event (str): The name of the event.
+
+        Returns:
+            asyncio.Event: The event.
+        """
+        async_event = self._async_events.get(event)
+        if async_event is None:
+            async_event = self._async_events[event] = asyncio.Event()
+        return async_event
+
     async def wait(self, event: str) -> None:
         """
         Waits for the event to be set before continuing.
@@ -53,14 +67,7 @@ class AsyncEventManager:
         Args:
             event (str): The name of the event to wait for.
         """
-        async with (
-            self._lock
-        ):  # Ensure thread-safe access to the _async_events dictionary.
-            if event not in self._async_events:
-                self._async_events[event] = asyncio.Event()
-            pass
-
-        await self._async_events[event].wait()
+        await self._get_event(event).wait()
 
     async def set(self, event: str) -> None:
         """
@@ -69,13 +76,7 @@ class AsyncEventManager:
         Args:
             event (str): The name of the event to set.
         """
-        async with (
-            self._lock
-        ):  # Ensure thread-safe access to the _async_events dictionary.
-            if event not in self._async_events:
-                self._async_events[event] = asyncio.Event()
-
-            self._async_events[event].set()
+        self._get_event(event).set()
 
     async def clear(self, event: str) -> None:
         """
@@ -84,12 +85,9 @@ class AsyncEventManager:
         Args:
             event (str): The name of the event to clear.
         """
-        async with (
-            self._lock
-        ):  # Ensure thread-safe access to the _async_events dictionary.
-            if event in self._async_events:
-                self._async_events[event].clear()
-            pass
+        async_event = self._async_events.get(event)
+        if async_event is not None:
+            async_event.clear()
 
     async def set_and_clear(self, event: str, delta: float = 0) -> None:
         """
@@ -113,10 +111,7 @@ class AsyncEventManager:
         Args:
             event (str): The name of the event to remove.
         """
-        async with self._lock:
-            if event in self._async_events:
-                del self._async_events[event]
-            pass
+        self._async_events.pop(event, None)
 
 
 class MessageInArgs(dict):
@@ -176,6 +171,13 @@ class EventErrorCallback(Protocol):
         """Callback for error events."""
 
 
+def _cleanup_upon_deletion(self: EventEmitterMixin):
+    """
+    Cleans up the EventEmitterMixin object upon deletion.
+    """
+    self.cleanup()
+
+
 class EventEmitterMixin:
     """EventEmitterMixin is a mixin class that provides methods for
     emitting and listening to events.
@@ -183,6 +185,8 @@ class EventEmitterMixin:
 
     default_listeners: Dict[str, List[EventCallback]] = {}
     default_error_listeners: List[EventErrorCallback] = []
+    # whether subclasses are cleaned up when they are deleted
+    _cleanup_on_delete: bool = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -214,12 +218,14 @@ class EventEmitterMixin:
         if hasattr(super(), "cleanup"):
             super().cleanup()
 
-    # Ensure to call cleanup before the object is deleted
-    def __del__(self):
+    def __init_subclass__(cls, **kwargs):
         """
-        Cleans up the EventEmitterMixin object upon deletion.
+        Ensures subclasses call cleanup before they are deleted, unless they opt out via
+        _cleanup_on_delete or define their own __del__.
         """
-        self.cleanup()
+        super().__init_subclass__(**kwargs)
+        if cls._cleanup_on_delete and not hasattr(cls, "__del__"):
+            cls.__del__ = _cleanup_upon_deletion
 
     def on(self, event_name: str, callback: EventCallback):
         """Adds a listener to the end of the listeners array for the specified event.
@@ -231,10 +237,11 @@ class EventEmitterMixin:
         callback : EventCallback
             The callback function.
         """
-        if event_name not in self._events:
-            self._events[event_name] = []
-        if callback not in self._events[event_name]:
-            self._events[event_name].append(callback)
+        # listener lists are replaced instead of mutated, so a running emit
+        # can iterate them without taking a copy
+        listeners = self._events.get(event_name, [])
+        if callback not in listeners:
+            self._events[event_name] = listeners + [callback]
 
     def on_error(self, callback: EventErrorCallback):
         """Adds a listener to the end of the listeners array for the error event.
@@ -245,7 +252,7 @@ class EventEmitterMixin:
             The callback function.
         """
         if callback not in self._error_events:
-            self._error_events.append(callback)
+            self._error_events = self._error_events + [callback]
 
     def off(self, event_name: str, callback: Optional[EventCallback] = None):
         """removes the specified listener from the listener array for the specified event.
@@ -257,15 +264,17 @@ class EventEmitterMixin:
             callback (Optional[EventCallback], optional): The callback function or None (will remove all listeners
             for the event). Defaults to None.
         """
-        if event_name not in self._events:
+        listeners = self._events.get(event_name)
+        if listeners is None:
             return
         if callback is None:
-            self._events[event_name] = []
-        else:
-            if callback in self._events[event_name]:
-                self._events[event_name].remove(callback)
-        if len(self._events[event_name]) == 0:
+            listeners = []
+        elif callback in listeners:
+            listeners = [cb for cb in listeners if cb != callback]
+        if len(listeners) == 0:
             del self._events[event_name]
+        else:
+            self._events[event_name] = listeners
 
     def off_error(self, callback: Optional[EventErrorCallback] = None):
         """removes the specified listener from the listener array for the error event.
@@ -280,7 +289,7 @@ class EventEmitterMixin:
         else:
             if callback not in self._error_events:
                 return
-            self._error_events.remove(callback)
+            self._error_events = [cb for cb in self._error_events if cb != callback]
 
     def once(self, event_name: str, callback: EventCallback):
         """Adds a one time listener for the event. This listener is invoked
@@ -342,6 +351,10 @@ class EventEmitterMixin:
         if not hasattr(self, "_events"):
             return False
         if msg is None:
+            # plain notifications (e.g. triggerstart, triggerdone, cleanup) without
+            # listeners return before any message is built
+            if event_name not in self._events and "*" not in self._events:
+                return False
             msg = MessageInArgs(src=self)
         if "src" in msg and msg["src"] is not self:
             raise ValueError("src is a reserved keyword")
@@ -34,6 +34,7 @@ from .utils.data import deep_fill_dict, deep_remove_dict_on_equal
 
 from .utils.serialization import JSONEncoder, JSONDecoder, Encdata
 import json
+import sys
 import weakref
 
 if TYPE_CHECKING:
@@ -380,7 +381,8 @@ class NodeIO(EventEmitterMixin, Generic[NodeIOType]):
 
         if uuid is None and id is not None:
             uuid = id
-        self._uuid = uuid or uuid4().hex
+        # interned, since the uuids are used as lookup keys all over the place
+        self._uuid = sys.intern(uuid or uuid4().hex)
         self._name = name or self._uuid
         self._description = description
         self._value: Union[NodeIOType, NoValueType] = NoValue
@@ -425,7 +427,13 @@ class NodeIO(EventEmitterMixin, Generic[NodeIOType]):
         if "description" in data:
             self._description = data["description"]
         if "id" in data:
-            self._uuid = data["id"]
+            uuid = sys.intern(data["id"])
+            if uuid != self._uuid:
+                self._uuid = uuid
+                # keep the uuid lookup of the node up to date
+                node = self.node
+                if node is not None:
+                    node._reindex_ios()
         if "value" in data:
             self._value = data["value"]
         if "hidden" in data:
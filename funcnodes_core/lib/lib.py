@@ -207,6 +207,20 @@ def update_nodes_in_shelf(shelf: Shelf, nodes: Sequence[Type[Node]]):
             shelf.add_node(node)
 
 
+def _find_node_in_shelf(shelf: Shelf, nodeid: str) -> Optional[Type[Node]]:
+    """
+    Returns the first node with the given id in the shelf or its subshelves, depth first
+    """
+    for node in shelf.nodes:
+        if node.node_id == nodeid:
+            return node
+    for subshelf in shelf.subshelves:
+        node = _find_node_in_shelf(subshelf, nodeid)
+        if node is not None:
+            return node
+    return None
+
+
 def deep_find_node(shelf: Shelf, nodeid: str, all=True) -> List[List[str]]:
     paths = []
     try:
@@ -425,8 +439,16 @@ class Library(EventEmitterMixin):
                     break
         return paths
 
+    def _find_node(self, nodeid: str) -> Optional[Type[Node]]:
+        # searches the shelves directly instead of resolving the paths of find_nodeid again
+        for shelf in self.shelves:
+            node = _find_node_in_shelf(shelf, nodeid)
+            if node is not None:
+                return node
+        return None
+
     def has_node_id(self, nodeid: str) -> bool:
-        return len(self.find_nodeid(nodeid, all=False)) > 0
+        return self._find_node(nodeid) is not None
 
     def find_nodeclass(self, node: Type[Node], all=True) -> List[List[str]]:
         return self.find_nodeid(node.node_id, all=all)
@@ -444,14 +466,10 @@ class Library(EventEmitterMixin):
             self.remove_nodeclass(node)
 
     def get_node_by_id(self, nodeid: str) -> Type[Node]:
-        paths = self.find_nodeid(nodeid, all=False)
-
-        if len(paths) == 0:
+        node = self._find_node(nodeid)
+        if node is None:
             raise NodeClassNotFoundError(f"Node with id '{nodeid}' not found")
-
-        shelf = self.get_shelf_from_path(paths[0])
-
-        return get_node_in_shelf(shelf, nodeid)[1]
+        return node
 
 
 class FullLibJSON(TypedDict):
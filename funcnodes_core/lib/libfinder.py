@@ -197,7 +197,7 @@ def find_shelf_from_path(
     if not data.get("skip_requirements", False):
         if "pyproject.toml" in os.listdir(data["path"]):
             fn.FUNCNODES_LOGGER.debug(
-                f"pyproject.toml found in {data['path']}, generating requirements.txt"
+                "pyproject.toml found in %s, generating requirements.txt", data["path"]
             )
             # install poetry requirements
             # save current path
@@ -213,7 +213,7 @@ def find_shelf_from_path(
             os.chdir(cwd)
         if "requirements.txt" in os.listdir(data["path"]):
             fn.FUNCNODES_LOGGER.debug(
-                f"requirements.txt found in {data['path']}, installing requirements"
+                "requirements.txt found in %s, installing requirements", data["path"]
             )
             # install pip requirements
             os.system(
@@ -259,7 +259,7 @@ def find_shelf(src: Union[ShelfDict, str]) -> Tuple[Shelf, ShelfDict] | None:
         return None
 
     # check if identifier is a python module e.g. "funcnodes.lib"
-    fn.FUNCNODES_LOGGER.debug(f"trying to import {src}")
+    fn.FUNCNODES_LOGGER.debug("trying to import %s", src)
 
     args = src.split(" ")
     src = args.pop(0)
@@ -3,7 +3,8 @@ from .lib import Shelf, Node
 import inspect
 from warnings import warn
 from .._logging import FUNCNODES_LOGGER
-from .._setup import setup_module, InstalledModule
+from .._setup import setup_module
+from ..utils.plugins_types import InstalledModule
 
 
 def module_to_shelf(mod, name: Optional[str] = None) -> Shelf:
@@ -11,7 +12,7 @@ def module_to_shelf(mod, name: Optional[str] = None) -> Shelf:
     Parses a single module for Nodes and and returns a filled shelf object.
     """  #
 
-    FUNCNODES_LOGGER.debug(f"parsing module {mod}")
+    FUNCNODES_LOGGER.debug("parsing module %s", mod)
     if not name:
         if hasattr(mod, "__name__"):
             name = str(mod.__name__)
@@ -28,7 +29,7 @@ def module_to_shelf(mod, name: Optional[str] = None) -> Shelf:
             return shelf
         except Exception as exc:
             FUNCNODES_LOGGER.info(
-                f"Error while parsing shelf from entry_points in module {mod}"
+                "Error while parsing shelf from entry_points in module %s", mod
             )
             FUNCNODES_LOGGER.exception(exc)
 
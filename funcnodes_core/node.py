@@ -15,6 +15,8 @@ from typing import (
 from abc import ABC, ABCMeta, abstractmethod
 import asyncio
 import inspect
+import sys
+from itertools import chain
 from uuid import uuid4
 from weakref import WeakValueDictionary, ref
 from .exceptions import NodeIdAlreadyExistsError
@@ -57,6 +59,36 @@ if TYPE_CHECKING:
 
 triggerlogger = get_logger("trigger")
 
+# io serialization keys that are dropped if they equal the class definition,
+# with the value assumed if the class definition does not contain the key
+_IO_CLASS_DEFAULTS = (
+    ("description", ""),
+    ("default", NoValue),
+    ("type", "Any"),
+    ("value_options", {}),
+    ("render_options", {}),
+)
+
+
+def _drop_class_io_defaults(node: Node, io_uuid: str, ioser: dict) -> dict:
+    """
+    Removes all entries from a serialized io that do not differ from the io definition of the node class.
+
+    Args:
+        node (Node): The node the io belongs to.
+        io_uuid (str): The uuid of the serialized io.
+        ioser (dict): The serialized io, modified in place.
+
+    Returns:
+        dict: The reduced serialized io.
+    """
+    cls_ser = node._class_io_serialized.get(io_uuid)
+    if cls_ser:
+        for key, default in _IO_CLASS_DEFAULTS:
+            if key in ioser and ioser[key] == cls_ser.get(key, default):
+                del ioser[key]
+    return ioser
+
 
 class IONotFoundError(KeyError):
     pass
@@ -295,6 +327,8 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
     node_name: str
     default_reset_inputs_on_trigger: bool = False
     description: Optional[str] = None
+    # nodes are not cleaned up upon deletion, they are freed together with their ios
+    _cleanup_on_delete = False
 
     default_render_options: RenderOptions = {}
     default_io_options: Dict[str, NodeInputOptions | NodeOutputOptions] = {}
@@ -310,10 +344,13 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
     )
 
     _class_io_serialized: Dict[str, NodeIOSerialization]
+    _class_template: BaseNodeJSON
+    _func_is_sync: bool = False
 
     @abstractmethod
     async def func(self, *args, **kwargs):
-        """The function to be executed when the node is triggered."""
+        """The function to be executed when the node is triggered.
+        Can also be implemented as a synchronous method."""
 
     def __init_subclass__(cls, **kwargs):
         ips = _get_nodeclass_inputs(cls)
@@ -326,7 +363,7 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
 
             # check if it is present in the previous
             while ipser["id"] in cls._class_io_serialized:
-                io._uuid = io.uuid + "_"
+                io._uuid = sys.intern(io.uuid + "_")
 
                 FUNCNODES_LOGGER.warning(
                     "IO with id %s already exists in %s. Changing id to %s",
@@ -338,6 +375,16 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
 
             cls._class_io_serialized[ipser["id"]] = ipser
 
+        # funcs that are not coroutine functions are called directly, their result is only
+        # awaited if it is awaitable
+        cls._func_is_sync = not asyncio.iscoroutinefunction(cls.func)
+
+        # class invariant part of the node serialization
+        cls._class_template = BaseNodeJSON(
+            node_id=getattr(cls, "node_id", None),
+            node_name=getattr(cls, "node_name", cls.__name__),
+        )
+
     def __init__(
         self,
         uuid: Optional[str] = None,
@@ -351,6 +398,8 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
         super().__init__()
         self._inputs: List[NodeInput] = []
         self._outputs: List[NodeOutput] = []
+        # uuid lookup for inputs and outputs, inputs take precedence on equal ids
+        self._io_by_uuid: Dict[str, NodeInput | NodeOutput] = {}
         self._triggerstack: Optional[TriggerStack] = None
         self._trigger_open = False
         self._requests_trigger = False
@@ -415,15 +464,14 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
 
     def full_serialize(self, with_io_values=False) -> FullNodeJSON:
         ser: FullNodeJSON = {
+            **self._class_template,
             "name": self.name,
             "id": self.uuid,
-            "node_id": self.node_id,
             "io": [
                 iod.full_serialize(with_value=with_io_values)
-                for iod in self._inputs + self._outputs
+                for iod in chain(self._inputs, self._outputs)
             ],
             "status": self.status(),
-            "node_name": self.node_name,
         }
 
         renderopt = self.render_options
@@ -453,10 +501,12 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
         if "reset_inputs_on_trigger" in data:
             self._reset_inputs_on_trigger = data["reset_inputs_on_trigger"]
 
-        if "io" in data:
-            for iod in self._inputs + self._outputs:
-                if iod.uuid in data["io"]:
-                    iod.deserialize(data["io"][iod.uuid])  # type: ignore
+        io_data = data.get("io")
+        if io_data:
+            for iod in chain(self._inputs, self._outputs):
+                iod_data = io_data.get(iod.uuid)
+                if iod_data is not None:
+                    iod.deserialize(iod_data)  # type: ignore
 
         if self.trigger_on_create:
             if self.ready_to_trigger():
@@ -468,48 +518,19 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
         """
 
         ser = NodeJSON(
+            **self._class_template,
             name=self.name,
             id=self.uuid,
-            node_id=self.node_id,
-            node_name=getattr(self, "node_name", self.__class__.__name__),
             io={},
         )
 
-        for iod in self._inputs + self._outputs:
+        for iod in chain(self._inputs, self._outputs):
             if iod.uuid == "_triggerinput":
                 continue
             ioser = dict(iod.serialize(drop=drop))
             if drop:
                 del ioser["id"]
-
-                cls_ser = None
-                if iod.uuid in self._class_io_serialized:
-                    cls_ser = self._class_io_serialized[iod.uuid]
-
-                if cls_ser:
-                    if "description" in ioser:
-                        if ioser["description"] == cls_ser.get("description", ""):
-                            del ioser["description"]
-
-                    if "default" in ioser:
-                        if ioser["default"] == cls_ser.get("default", NoValue):
-                            del ioser["default"]
-
-                    if "type" in ioser:
-                        if ioser["type"] == cls_ser.get("type", "Any"):
-                            del ioser["type"]
-
-                    if "value_options" in ioser:
-                        if ioser["value_options"] == cls_ser.get("value_options", {}):
-                            del ioser["value_options"]
-
-                    if "render_options" in ioser:
-                        if ioser["render_options"] == cls_ser.get("render_options", {}):
-                            del ioser["render_options"]
-
-                    if "default" in ioser:
-                        if ioser["default"] == cls_ser.get("default", NoValue):
-                            del ioser["default"]
+                _drop_class_io_defaults(self, iod.uuid, ioser)
 
             ser["io"][iod.uuid] = ioser
 
@@ -698,7 +719,9 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
             raise ValueError(f"Input with id {ipid} already exists")
         node_input.on("*", self.on_nodeio_event)
         self._inputs.append(node_input)
+        self._io_by_uuid[ipid] = node_input
         node_input.node = self
+        self._invalidate_nodespace_edges()
 
     def remove_input(self, node_input: NodeInput):
         """
@@ -714,6 +737,8 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
             raise ValueError(f"Input with id {node_input.uuid} not found")
         node_input.off("*", self.on_nodeio_event)
         self._inputs.remove(node_input)
+        self._unindex_io(node_input)
+        self._invalidate_nodespace_edges()
 
     def add_output(self, node_output: NodeOutput):
         """
@@ -731,6 +756,8 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
         node_output.on("*", self.on_nodeio_event)
         node_output.node = self
         self._outputs.append(node_output)
+        self._io_by_uuid.setdefault(opid, node_output)
+        self._invalidate_nodespace_edges()
 
     def remove_output(self, node_output: NodeOutput):
         """
@@ -746,6 +773,48 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
             raise ValueError(f"Output with id {node_output.uuid} not found")
         node_output.off("*", self.on_nodeio_event)
         self._outputs.remove(node_output)
+        self._unindex_io(node_output)
+        self._invalidate_nodespace_edges()
+
+    def _invalidate_nodespace_edges(self):
+        """Marks the edges of the node's nodespace as outdated, since ios may bring or take connections."""
+        nodespace = self.nodespace
+        if nodespace is not None:
+            nodespace.invalidate_edges()
+
+    def _reindex_ios(self):
+        """
+        Rebuilds the uuid lookup of the inputs and outputs, e.g. after the uuid of an io changed.
+        Inputs take precedence over outputs with the same uuid.
+
+        Returns:
+            None
+        """
+        io_by_uuid: Dict[str, NodeInput | NodeOutput] = {}
+        for op in self._outputs:
+            io_by_uuid.setdefault(op.uuid, op)
+        for ip in self._inputs:
+            io_by_uuid[ip.uuid] = ip
+        self._io_by_uuid = io_by_uuid
+
+    def _unindex_io(self, io: NodeInput | NodeOutput):
+        """
+        Removes an io from the uuid lookup, falling back to a remaining io with the same uuid.
+
+        Args:
+            io (NodeInput | NodeOutput): The removed io.
+
+        Returns:
+            None
+        """
+        uuid = io.uuid
+        if self._io_by_uuid.get(uuid) is not io:
+            return
+        del self._io_by_uuid[uuid]
+        for other in chain(self._inputs, self._outputs):
+            if other.uuid == uuid:
+                self._io_by_uuid[uuid] = other
+                break
 
     def on_nodeio_event(self, event: str, src: NodeInput | NodeOutput, **data):
         """
@@ -764,7 +833,7 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
 
     def inputs_ready(self):
         """Whether all the node's inputs are ready."""
-        return all(map(lambda x: x.ready(), self._inputs))
+        return all(ip.ready() for ip in self._inputs)
 
     def get_input(self, uuid: str) -> NodeInput:
         """Returns the input with the given uuid.
@@ -803,16 +872,10 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
         Returns:
             NodeInput | NodeOutput: The input or output with the given uuid.
         """
-
-        try:
-            return self.get_input(uuid)
-        except IONotFoundError:
-            pass
-        try:
-            return self.get_output(uuid)
-        except IONotFoundError:
-            pass
-        raise IONotFoundError(f"Input or Output with uuid {uuid} not found")
+        io = self._io_by_uuid.get(uuid)
+        if io is None:
+            raise IONotFoundError(f"Input or Output with uuid {uuid} not found")
+        return io
 
     # endregion input/output methods
 
@@ -826,47 +889,52 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
         Returns:
             asyncio.Task: The task object representing the asynchronous operation of the node's function.
         """
+        # create the task, which runs in a copy of the caller's context
+        task = asyncio.create_task(self._run_trigger())
+        return task
+
+    async def _run_trigger(self):
+        """Runs the node's function and handles the triggering of events before and after its execution."""
+        # set the trigger event
+        await self.asynceventmanager.set_and_clear("triggered")
+        await asyncio.sleep(self._pretrigger_delay)
+        self._trigger_open = False
+        self.emit("triggerstart")
+
+        kwargs = {
+            ip.uuid: ip.value
+            for ip in self._inputs
+            if ip.uuid != "_triggerinput" and ip.value is not NoValue
+        }
 
-        async def _wrapped_func():
-            """Wraps the node's function to handle the triggering of events before and after its execution."""
-            # set the trigger event
-            await self.asynceventmanager.set_and_clear("triggered")
-            await asyncio.sleep(self._pretrigger_delay)
-            self._trigger_open = False
-            self.emit("triggerstart")
-
-            kwargs = {
-                ip.uuid: ip.value for ip in self._inputs if ip.value is not NoValue
-            }
-
-            err = None
-            if "_triggerinput" in kwargs:
-                del kwargs["_triggerinput"]
-            try:
-                with self.progress(total=None, desc="triggering") as pbar:
-                    # run the function
+        err = None
+        try:
+            with self.progress(total=None, desc="triggering") as pbar:
+                # run the function
+                if self._func_is_sync:
+                    ans = self.func(**kwargs)
+                    # sync wrappers (e.g. decorators) may still return an awaitable
+                    if inspect.isawaitable(ans):
+                        ans = await ans
+                else:
                     ans = await self.func(**kwargs)
-                    # reset the inputs if requested
-                    if self.reset_inputs_on_trigger:
-                        for ip in self._inputs:
-                            ip.set_value(ip.default, does_trigger=False)
-                    # pbar.update(1)
-                    pbar.set_description_str("idle", refresh=False)
-            except Exception as e:
-                err = e
-
-            self.emit("triggerdone")
-
-            # set the triggerdone event
-            await self.asynceventmanager.set_and_clear("triggerdone")
-            if err:
-                self.error(NodeTriggerError.from_error(err))
-                ans = err
-            return ans
-
-        # create the task
-        task = asyncio.create_task(_wrapped_func())
-        return task
+                # reset the inputs if requested
+                if self.reset_inputs_on_trigger:
+                    for ip in self._inputs:
+                        ip.set_value(ip.default, does_trigger=False)
+                # pbar.update(1)
+                pbar.set_description_str("idle", refresh=False)
+        except Exception as e:
+            err = e
+
+        self.emit("triggerdone")
+
+        # set the triggerdone event
+        await self.asynceventmanager.set_and_clear("triggerdone")
+        if err:
+            self.error(NodeTriggerError.from_error(err))
+            ans = err
+        return ans
 
     def trigger_if_requested(self, triggerstack: Optional[TriggerStack] = None) -> bool:
         """
@@ -958,7 +1026,7 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
             triggerstack = TriggerStack()
         self._pretrigger_delay = 0.02  # 20ms
         self._trigger_open = True
-        triggerlogger.debug(f"triggering {self}")
+        triggerlogger.debug("triggering %s", self)
         self._triggerstack = triggerstack
         self._triggerstack.append(self())
         self._requests_trigger = False
@@ -976,19 +1044,14 @@ class Node(EventEmitterMixin, ABC, metaclass=NodeMeta):
 
         super().cleanup()
 
-    def __del__(self):
-        self.cleanup()
-
     def __getitem__(self, item):
         return self.get_input_or_output(item)
 
     def __setitem__(self, key, value):
-        if key in self.inputs:
-            self.inputs[key].value = value
-        elif key in self.outputs:
-            self.outputs[key].value = value
-        else:
+        io = self._io_by_uuid.get(key)
+        if io is None:
             raise KeyError(f"No input or output named '{key}' found.")
+        io.value = value
 
 
 class NodeReadyState(TypedDict):
@@ -1065,19 +1128,28 @@ ALLOW_REGISTERED_NODES_OVERRIDE = False
 
 
 def _get_node_src(node: Type[Node]) -> str:
-    try:
-        file = inspect.getfile(node)
-    except Exception:
-        file = "<unknown file>"
-    try:
-        line = inspect.getsourcelines(node)[1]
-    except Exception:
+    """
+    Returns a short "module(file:line)" description of where a node class is defined.
+    Only uses code object attributes, so no source file has to be read.
+    """
+    module = getattr(node, "__module__", None) or "<unknown module>"
+    file = "<unknown file>"
+    line = getattr(node, "__firstlineno__", None)  # python >= 3.13
+
+    for attr in vars(node).values():
+        if not callable(attr):
+            continue
+        # follow functools.wraps chains, e.g. of decorator generated nodes
+        code = getattr(inspect.unwrap(attr), "__code__", None)
+        if code is None:
+            continue
+        file = code.co_filename
+        if line is None:
+            line = code.co_firstlineno
+        break
+
+    if line is None:
         line = "<unknown line>"
-
-    try:
-        module = node.__module__
-    except Exception:
-        module = "<unknown module>"
     return f"{module}({file}:{line})"
 
 
@@ -1147,6 +1219,9 @@ class PlaceHolderNode(Node):
     def deserialize(self, data: NodeJSON):
         self.node_id = data["node_id"]
         self.node_name = data["node_name"]
+        self._class_template = BaseNodeJSON(
+            node_id=self.node_id, node_name=self.node_name
+        )
 
         for ip in self._inputs:
             self.remove_input(ip)
@@ -1176,11 +1251,9 @@ def nodeencoder(obj, preview=False) -> Tuple[Any, bool]:
     if isinstance(obj, Node):
         ser: FullNodeJSON = obj.full_serialize(with_io_values=False)
         # io values should be serialized as preview
-        serios = []
-        for iod in ser["io"]:
-            serios.append(JSONEncoder.apply_custom_encoding(iod, preview=True))
-
-        ser["io"] = serios
+        ser["io"] = [
+            JSONEncoder.apply_custom_encoding(iod, preview=True) for iod in ser["io"]
+        ]
 
         return ser, True
     return obj, False
@@ -92,6 +92,10 @@ def node_class_maker(
     else:
         asyncfunc = make_async_if_needed(in_func)
 
+    # resolved once here instead of on every trigger
+    output_names = [op.name for op in outputs]
+    multiple_outputs = len(output_names) > 1
+
     @wraps(asyncfunc)
     async def _wrapped_func(self: Node, *args, **kwargs):
         """
@@ -102,11 +106,13 @@ def node_class_maker(
             kwargs["node"] = self
 
         outs = await asyncfunc(*args, **kwargs)
-        if len(outputs) > 1:
-            for op, out in zip(outputs, outs):
-                self.outputs[op.name].value = out
-        elif len(outputs) == 1:
-            self.outputs[outputs[0].name].value = outs
+        if output_names:
+            node_outputs = self.outputs
+            if multiple_outputs:
+                for name, out in zip(output_names, outs):
+                    node_outputs[name].value = out
+            else:
+                node_outputs[output_names[0]].value = outs
         return outs
 
     kwargs.setdefault("node_name", in_func.ef_funcmeta.get("name", id))
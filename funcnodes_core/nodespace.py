@@ -1,8 +1,12 @@
-from typing import List, Dict, TypedDict, Tuple, Any
+from typing import List, Dict, TypedDict, Tuple, Any, Type
 import json
 from uuid import uuid4
 import traceback
 import os
+import gc
+from contextlib import contextmanager
+from collections import defaultdict
+from itertools import chain
 
 from .node import (
     FullNodeJSON,
@@ -12,7 +16,7 @@ from .node import (
     Node,
     run_until_complete,
 )  #
-from .io import NodeInput, NodeOutput
+from .io import NodeInput, NodeOutput, NodeIOError
 
 
 from .lib import FullLibJSON, Library, NodeClassNotFoundError, Shelf, flatten_shelf
@@ -51,6 +55,29 @@ class NodeSpaceJSON(TypedDict, total=False):
     prop: Dict[str, Any]
 
 
+@contextmanager
+def _paused_gc():
+    """
+    Disables the cyclic garbage collector for the enclosed block, which creates many small
+    dicts and lists that would otherwise trigger repeated collections.
+    The previous state is restored afterwards, so the helper can be nested.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+# property values that never need a json serializability check
+_JSON_PRIMITIVES = (str, int, float, bool, type(None))
+
+# io events that change the edges of a NodeSpace
+_EDGE_EVENTS = ("after_connect", "after_disconnect", "after_forward", "after_unforward")
+
+
 class NodeSpace(EventEmitterMixin):
     """
     NodeSpace is a manager and container for nodes and edges between them.
@@ -68,6 +95,8 @@ class NodeSpace(EventEmitterMixin):
         super().__init__()
         self._nodes: Dict[str, Node] = {}
         self._properties: Dict[str, Any] = {}
+        self._edge_cache: List[Tuple[NodeOutput, NodeInput]] = []
+        self._edges_dirty = False
         self.lib = Library()
         if id is None:
             id = uuid4().hex
@@ -94,21 +123,51 @@ class NodeSpace(EventEmitterMixin):
         """
         return list(self._nodes.values())
 
+    def _nodes_snapshot(self) -> Tuple[Node, ...]:
+        """
+        Returns an immutable snapshot of the nodes, for loops that add or remove nodes.
+
+        Returns:
+          Tuple[Node, ...]: The nodes in the NodeSpace.
+        """
+        return tuple(self._nodes.values())
+
     @property
     def edges(self) -> List[Tuple[NodeOutput, NodeInput]]:
         """
         Returns a list of all edges in the NodeSpace.
 
+        Returns:
+          List[Tuple[NodeOutput, NodeInput]]: A list of all edges in the NodeSpace.
+        """
+        if self._edges_dirty:
+            self._edge_cache = self._collect_edges()
+            self._edges_dirty = False
+        return list(self._edge_cache)
+
+    def invalidate_edges(self):
+        """
+        Marks the cached edges as outdated, so they are collected again on the next access.
+        Connection changes of nodes in the NodeSpace are tracked automatically.
+        """
+        self._edges_dirty = True
+        self._edge_cache = []  # do not keep ios of removed nodes alive
+
+    def _collect_edges(self) -> List[Tuple[NodeOutput, NodeInput]]:
+        """
+        Collects all edges by walking the ios of all nodes in the NodeSpace.
+
         Returns:
           List[Tuple[NodeOutput, NodeInput]]: A list of all edges in the NodeSpace.
         """
         edges: List[Tuple[NodeOutput, NodeInput]] = []
-        for node in self.nodes:
-            for output in node.outputs.values():
-                for input in output.connections:
+        # every edge is only reachable from its source io
+        for node in self._nodes.values():
+            for output in node._outputs:
+                for input in output._connected:
                     edges.append((output, input))
 
-            for inputstart in node.inputs.values():
+            for inputstart in node._inputs:
                 for inputend in inputstart.get_forward_connections():
                     edges.append((inputstart, inputend))
 
@@ -159,22 +218,26 @@ class NodeSpace(EventEmitterMixin):
         if filepath is not None and os.path.exists(filepath):
             os.remove(filepath)
 
-    def set_property(self, key: str, value: Any):
+    def set_property(self, key: str, value: Any, validate: bool = True):
         """
         Sets a property in the NodeSpace.
 
         Args:
           key (str): The key of the property to set.
           value (Any): The value to set the property to.
+          validate (bool): Whether to check that the value is json serializable. Trusted callers
+            setting large containers can skip the check. Defaults to True.
         """
         # make sure value is json serializable and key is a string
         if not isinstance(key, str):
             raise ValueError("key must be a string")
 
-        try:
-            json.dumps(value)
-        except Exception as e:
-            raise ValueError(f"value must be json serializable: {e}")
+        # primitives are always serializable, only containers need the encode pass
+        if validate and not isinstance(value, _JSON_PRIMITIVES):
+            try:
+                json.dumps(value)
+            except Exception as e:
+                raise ValueError(f"value must be json serializable: {e}")
 
         self._properties[key] = value
 
@@ -208,6 +271,35 @@ class NodeSpace(EventEmitterMixin):
             "edges": self.serialize_edges(),
         }
 
+    def full_serialize_bytes(self, with_io_values=False) -> bytes:
+        """
+        Serializes the NodeSpace like full_serialize, directly into utf-8 encoded JSON.
+        The nodes are encoded one after another, so their serialized dicts do not have to be kept
+        in memory at the same time.
+
+        Returns:
+          bytes: The JSON representation of the full serialized NodeSpace.
+        """
+        nodes = b",".join(
+            json.dumps(
+                node.full_serialize(with_io_values=with_io_values), cls=JSONEncoder
+            ).encode("utf-8")
+            for node in self._nodes.values()
+        )
+        return b"".join(
+            (
+                b'{"nodes":[',
+                nodes,
+                b'],"prop":',
+                json.dumps(self._properties, cls=JSONEncoder).encode("utf-8"),
+                b',"lib":',
+                json.dumps(self.lib.full_serialize(), cls=JSONEncoder).encode("utf-8"),
+                b',"edges":',
+                json.dumps(self.serialize_edges(), cls=JSONEncoder).encode("utf-8"),
+                b"}",
+            )
+        )
+
     def full_nodes_serialize(self, with_io_values=False) -> List[FullNodeJSON]:
         """
         Serializes all nodes in the NodeSpace.
@@ -216,7 +308,8 @@ class NodeSpace(EventEmitterMixin):
           List[FullNodeJSON]: A list of JSON objects containing the serialized nodes.
         """
         return [
-            node.full_serialize(with_io_values=with_io_values) for node in self.nodes
+            node.full_serialize(with_io_values=with_io_values)
+            for node in self._nodes.values()
         ]
 
     def deserialize_nodes(self, data: List[NodeJSON]):
@@ -233,16 +326,23 @@ class NodeSpace(EventEmitterMixin):
         Dict[str, Node]
             the deserialized nodes
         """
-        for node in self.nodes:
-            self.remove_node_instance(node)
-        for node in data:
-            try:
-                node_cls = self.lib.get_node_by_id(node["node_id"])
-            except NodeClassNotFoundError:
-                node_cls = PlaceHolderNode
-            node_instance = node_cls()
-            node_instance.deserialize(node)
-            self.add_node_instance(node_instance)
+        with _paused_gc():
+            for node in self._nodes_snapshot():
+                self.remove_node_instance(node)
+            # node classes are usually reused, so every id is only looked up once
+            cls_cache: Dict[str, Type[Node]] = {}
+            for node in data:
+                node_id = node["node_id"]
+                node_cls = cls_cache.get(node_id)
+                if node_cls is None:
+                    try:
+                        node_cls = self.lib.get_node_by_id(node_id)
+                    except NodeClassNotFoundError:
+                        node_cls = PlaceHolderNode
+                    cls_cache[node_id] = node_cls
+                node_instance = node_cls()
+                node_instance.deserialize(node)
+                self.add_node_instance(node_instance)
 
     def deserialize_edges(self, data: List[Tuple[str, str, str, str]]):
         """
@@ -251,15 +351,21 @@ class NodeSpace(EventEmitterMixin):
         Args:
           data (List[Tuple[str, str, str, str]]): A list of tuples containing the UUIDs and IDs of the connected nodes.
         """
+        nodes = self._nodes
         for output_uuid, output_id, input_uuid, input_id in data:
+            output_node = nodes.get(output_uuid)
+            input_node = nodes.get(input_uuid)
+            if output_node is None or input_node is None:
+                # dangling edge or node that could not be deserialized
+                continue
             try:
-                output = self.get_node_by_id(output_uuid).get_input_or_output(output_id)
-                input = self.get_node_by_id(input_uuid).get_input_or_output(input_id)
+                output = output_node.get_input_or_output(output_id)
+                input = input_node.get_input_or_output(input_id)
                 if isinstance(output, NodeOutput) and isinstance(input, NodeInput):
                     input.connect(output)
                 else:
                     output.connect(input)
-            except Exception:
+            except (KeyError, NodeIOError):  # missing io or invalid connection
                 pass
 
     def serialize_nodes(self) -> List[NodeJSON]:
@@ -270,10 +376,21 @@ class NodeSpace(EventEmitterMixin):
         List[NodeJSON]
             the serialized nodes
         """
-        ret = []
-        for node in self.nodes:
-            ret.append(node.serialize())
-        return json.loads(json.dumps(ret, cls=JSONEncoder), cls=JSONDecoder)
+        with _paused_gc():
+            return json.loads(
+                json.dumps(self._serialize_nodes_raw(), cls=JSONEncoder),
+                cls=JSONDecoder,
+            )
+
+    def _serialize_nodes_raw(self) -> List[NodeJSON]:
+        """serializes the nodes in the nodespace without making them json compatible
+
+        Returns
+        -------
+        List[NodeJSON]
+            the serialized nodes
+        """
+        return [node.serialize() for node in self._nodes.values()]
 
     def serialize_edges(self) -> List[Tuple[str, str, str, str]]:
         """
@@ -282,15 +399,23 @@ class NodeSpace(EventEmitterMixin):
         Returns:
           List[Tuple[str, str, str, str]]: A list of tuples containing the UUIDs and IDs of the connected nodes.
         """
-        return [
-            (output.node.uuid, output.uuid, input.node.uuid, input.uuid)
-            for output, input in self.edges
-            if output.node is not None and input.node is not None
-        ] + [
-            (output.node.uuid, output.uuid, input.node.uuid, input.uuid)
-            for output, input in self.edges
-            if output.node is not None and input.node is None
-        ]
+        if not self._nodes:
+            return []
+        edges = []
+        # edges with a missing input node are appended at the end
+        dangling_edges = []
+        for output, input in self.edges:
+            output_node = output.node
+            if output_node is None:
+                continue
+            input_node = input.node
+            if input_node is not None:
+                edges.append(
+                    (output_node.uuid, output.uuid, input_node.uuid, input.uuid)
+                )
+            else:
+                dangling_edges.append((output_node.uuid, output.uuid, None, input.uuid))
+        return edges + dangling_edges
 
     def deserialize(self, data: NodeSpaceJSON):
         """
@@ -301,10 +426,16 @@ class NodeSpace(EventEmitterMixin):
         data : NodeSpaceJSON
             the data to deserialize
         """
-        self.clear()
-        self._properties = data.get("prop", {})
-        self.deserialize_nodes(data.get("nodes", []))
-        self.deserialize_edges(data.get("edges", []))
+        with _paused_gc():
+            self.clear()
+            self._properties = data.get("prop", {})
+            nodes = data.get("nodes")
+            if nodes:
+                self.deserialize_nodes(nodes)
+                # edges can only connect deserialized nodes
+                edges = data.get("edges")
+                if edges:
+                    self.deserialize_edges(edges)
         self._check_files()
 
     def serialize(self) -> NodeSpaceJSON:
@@ -315,17 +446,19 @@ class NodeSpace(EventEmitterMixin):
         NodeSpaceSerializationInterface
             the serialized nodespace
         """
-        ret = NodeSpaceJSON(
-            nodes=self.serialize_nodes(),
-            edges=self.serialize_edges(),
-            prop=self._properties,
-        )
-        return json.loads(json.dumps(ret, cls=JSONEncoder), cls=JSONDecoder)
+        with _paused_gc():
+            ret = NodeSpaceJSON(
+                nodes=self._serialize_nodes_raw(),
+                edges=self.serialize_edges(),
+                prop=self._properties,
+            )
+            return json.loads(json.dumps(ret, cls=JSONEncoder), cls=JSONDecoder)
 
     def clear(self):
         """clear removes all nodes and edges from the nodespace"""
-        for node in self.nodes:
-            self.remove_node_instance(node)
+        if self._nodes:
+            for node in self._nodes_snapshot():
+                self.remove_node_instance(node)
 
         self._properties = {}
 
@@ -342,10 +475,18 @@ class NodeSpace(EventEmitterMixin):
         node : Node
             the node to add
         """
-        if node.uuid in self._nodes:
+        n_nodes = len(self._nodes)
+        # single hash probe, the dict only grows if the uuid was not present yet
+        self._nodes.setdefault(node.uuid, node)
+        if len(self._nodes) == n_nodes:
             raise ValueError(f"node with uuid '{node.uuid}' already exists")
-        self._nodes[node.uuid] = node
+        self.invalidate_edges()
         node.nodespace = self
+        # events the nodespace reacts to get their own listeners, so relaying all other
+        # events does not need to check the event name
+        node.on("cleanup", self._on_node_cleanup)
+        for event in _EDGE_EVENTS:
+            node.on(event, self._on_node_edges_changed)
         node.on("*", self.on_node_event)
         node.on_error(self.on_node_error)
         node_ser = node.serialize()
@@ -363,12 +504,30 @@ class NodeSpace(EventEmitterMixin):
           src (Node): The node that emitted the event.
           **data: Additional data passed with the event.
         """
-        if event == "cleanup":
-            self.remove_node_instance(src)
-            return
         msg = MessageInArgs(node=src.uuid, **data)
         self.emit(event, msg)
 
+    def _on_node_cleanup(self, src: Node, **data):
+        """
+        Removes a node from the NodeSpace when it is cleaned up.
+        Since event specific listeners run before the relaying wildcard listener,
+        the cleanup event itself is not relayed.
+
+        Args:
+          src (Node): The node that is cleaned up.
+          **data: Additional data passed with the event.
+        """
+        self.remove_node_instance(src)
+
+    def _on_node_edges_changed(self, **data):
+        """
+        Invalidates the cached edges when an io of a node in the NodeSpace changes its connections.
+
+        Args:
+          **data: The data passed with the event.
+        """
+        self.invalidate_edges()
+
     def on_node_error(self, src: Node, error: Exception):
         """
         Handles errors emitted by nodes in the NodeSpace.
@@ -397,23 +556,24 @@ class NodeSpace(EventEmitterMixin):
         Returns:
           str: The UUID of the removed node.
         """
-        if node.uuid not in self._nodes:
+        nodes = self._nodes
+        removed = nodes.pop(node.uuid, None)
+        if removed is None:
             raise ValueError(f"node with uuid '{node.uuid}' not found in nodespace")
-
-        node = self._nodes.pop(node.uuid)
+        node = removed
+        self.invalidate_edges()
         node.nodespace = None
         node.off("*", self.on_node_event)
+        node.off("cleanup", self._on_node_cleanup)
+        for event in _EDGE_EVENTS:
+            node.off(event, self._on_node_edges_changed)
 
-        for output in node.outputs.values():
-            for input in output.connections:
-                if input.node is not None:
-                    if input.node.uuid in self._nodes:
-                        output.disconnect(input)
-        for input in node.inputs.values():
-            for output in input.connections:
-                if output.node is not None:
-                    if output.node.uuid in self._nodes:
-                        output.disconnect(input)
+        # disconnect from the remaining nodes, connections to nodes outside the nodespace are kept
+        for io in chain(node._outputs, node._inputs):
+            for partner in io.connections:  # connections returns a copy
+                partner_node = partner.node
+                if partner_node is not None and partner_node.uuid in nodes:
+                    io.disconnect(partner)
 
         msg = MessageInArgs(node=node.uuid)
         self.emit("node_removed", msg)
@@ -468,9 +628,10 @@ class NodeSpace(EventEmitterMixin):
         Returns:
           Node: The node with the given id.
         """
-        if nid not in self._nodes:
+        node = self._nodes.get(nid)
+        if node is None:
             raise ValueError(f"node with id '{nid}' not found in nodespace")
-        return self._nodes[nid]
+        return node
 
     # endregion nodes
 
@@ -511,14 +672,20 @@ class NodeSpace(EventEmitterMixin):
         self.lib.remove_shelf(shelf)
         if with_nodes:
             nodes, _ = flatten_shelf(shelf)
+            by_node_id: Dict[str, List[Node]] = defaultdict(list)
+            for nodespacenode in self._nodes.values():
+                by_node_id[nodespacenode.node_id].append(nodespacenode)
 
             for node in nodes:
+                # pop, so ids that appear in several subshelves are only handled once
+                instances = by_node_id.pop(node.node_id, None)
+                if not instances:
+                    continue
                 try:
                     self.lib.get_node_by_id(node.node_id)
                 except NodeClassNotFoundError:
-                    for nodespacenode in self.nodes:
-                        if nodespacenode.node_id == node.node_id:
-                            self.remove_node_instance(nodespacenode)
+                    for nodespacenode in instances:
+                        self.remove_node_instance(nodespacenode)
         return self.lib
 
     # endregion lib
@@ -526,7 +693,7 @@ class NodeSpace(EventEmitterMixin):
         self,
     ):
         """await_done waits until all nodes are done"""
-        return await run_until_complete(*self.nodes)
+        return await run_until_complete(*self._nodes.values())
 
 
 def nodespaceendcoder(obj, preview=False):
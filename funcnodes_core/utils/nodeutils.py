@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Set, Optional, TYPE_CHECKING
+from typing import Dict, Set, Optional, TYPE_CHECKING
 import asyncio
 
 if TYPE_CHECKING:
@@ -10,7 +10,7 @@ def get_deep_connected_nodeset(
     src: Node, nodeset: Optional[Set[Node]] = None
 ) -> Set[Node]:
     """
-    Recursively collects all the nodes that are connected to the source node, including those
+    Collects all the nodes that are connected to the source node, including those
     connected indirectly through other nodes' outputs. This function traverses the graph of nodes
     starting from the source node.
 
@@ -25,20 +25,26 @@ def get_deep_connected_nodeset(
     # Initialize the nodeset if not provided.
     if nodeset is None:
         nodeset = set()
-    # If the source node is already in the set, return the set to avoid infinite recursion.
+    # If the source node is already in the set, there is nothing left to collect.
     if src in nodeset:
         return nodeset
 
     # Add the source node to the set.
     nodeset.add(src)
 
-    # Iterate through all the outputs of the source node.
-    for out in src._outputs:
-        # For each output, iterate through its connections.
-        for con in out.connections:
-            # If the connected node is not already in the set, recurse with the connected node.
-            if con.node and con.node not in nodeset:
-                get_deep_connected_nodeset(con.node, nodeset)
+    # Traverse iteratively, so deep pipelines do not hit the recursion limit.
+    stack = [src]
+    while stack:
+        node = stack.pop()
+        # Iterate through all the outputs of the node.
+        for out in node._outputs:
+            # For each output, iterate through its connections.
+            for con in out._connected:
+                # If the connected node is not already in the set, visit it later.
+                connected_node = con.node
+                if connected_node and connected_node not in nodeset:
+                    nodeset.add(connected_node)
+                    stack.append(connected_node)
 
     # Return the set containing all connected nodes.
     return nodeset
@@ -56,20 +62,32 @@ async def run_until_complete(*nodes: Node) -> None:
     Returns:
         None
     """
-    # trigger nodes that are requested to be triggered
-    for node in nodes:
-        node.trigger_if_requested()
+    # the pending trigger waits, kept across iterations so every node is awaited only once per trigger
+    waiting: Dict[Node, asyncio.Future] = {}
+    try:
+        while True:
+            # trigger nodes that are requested to be triggered
+            for node in nodes:
+                node.trigger_if_requested()
 
-    # Get the list of nodes that are in a trigger state.
-    triggernodes = [node for node in nodes if node.in_trigger]
+            # wait for all nodes that are in a trigger state
+            for node in nodes:
+                if node not in waiting and node.in_trigger:
+                    waiting[node] = asyncio.ensure_future(
+                        node.wait_for_trigger_finish()
+                    )
+            if not waiting:
+                return
 
-    # Continue the loop while any node is in a trigger state.
-    while triggernodes:
-        # Wait for a short interval to prevent a tight loop that could lock up resources.
-        await asyncio.gather(*[n.wait_for_trigger_finish() for n in triggernodes])
-        # Iterate through each node.
-        for node in nodes:
-            # If the node requests a trigger, trigger it.
-            node.trigger_if_requested()
-        # Get the list of nodes that are in a trigger state.
-        triggernodes = [node for node in nodes if node.in_trigger]
+            # continue as soon as any node finished, so requested triggers are not held back
+            # by slower nodes
+            done, _ = await asyncio.wait(
+                waiting.values(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for node, wait in list(waiting.items()):
+                if wait in done:
+                    del waiting[node]
+                    wait.result()
+    finally:
+        for wait in waiting.values():
+            wait.cancel()
@@ -18,19 +18,20 @@ def get_installed_modules() -> Dict[str, InstalledModule]:
                 loaded = ep.load()
             module_name = ep.value
 
-            if module_name not in named_objects:
-                named_objects[module_name] = InstalledModule(
+            installed_module = named_objects.get(module_name)
+            if installed_module is None:
+                installed_module = named_objects[module_name] = InstalledModule(
                     name=module_name,
                     entry_points={},
                     module=None,
                 )
 
-            named_objects[module_name].entry_points[ep.name] = loaded
+            installed_module.entry_points[ep.name] = loaded
             if ep.name == "module":
-                named_objects[module_name].module = loaded
+                installed_module.module = loaded
 
             # Populate version and description if not already set
-            if not named_objects[module_name].description:
+            if not installed_module.description:
                 try:
                     package_metadata = ep.dist.metadata
                     description = package_metadata.get(
@@ -38,11 +39,11 @@ def get_installed_modules() -> Dict[str, InstalledModule]:
                     )
                 except Exception as e:
                     description = f"Could not retrieve description: {str(e)}"
-                named_objects[module_name].description = description
+                installed_module.description = description
 
-            if not named_objects[module_name].version:
+            if not installed_module.version:
                 try:
-                    named_objects[module_name].version = ep.dist.version
+                    installed_module.version = ep.dist.version
                 except Exception:
                     pass
         except AttributeError:
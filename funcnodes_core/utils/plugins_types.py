@@ -45,5 +45,4 @@ class InstalledModule:
             f"render_options={self.render_options is not None})"
         )
 
-    def __str__(self) -> str:
-        return self.__repr__()
+    __str__ = __repr__
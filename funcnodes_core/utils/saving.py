@@ -1,4 +1,5 @@
 import json
+from itertools import chain
 from funcnodes_core import (
     NodeSpace,
     JSONEncoder,
@@ -6,9 +7,9 @@ from funcnodes_core import (
     NodeSpaceJSON,
     Node,
     NodeJSON,
-    NoValue,
     NodeIO,
 )
+from funcnodes_core.node import _drop_class_io_defaults
 
 
 def serialize_nodeio_for_saving(io: NodeIO):
@@ -27,7 +28,8 @@ def serialize_node_for_saving(node: Node):
         io={},
     )
 
-    for iod in list(node.inputs.values()) + list(node.outputs.values()):
+    # the io objects are iterated directly, the inputs/outputs properties would build new dicts
+    for iod in chain(node._inputs, node._outputs):
         if iod.uuid == "_triggerinput":
             continue
         ioser = dict(serialize_nodeio_for_saving(iod))
@@ -36,30 +38,7 @@ def serialize_node_for_saving(node: Node):
 
         # checking of the input is defined on a node class leven, if this is the case reduntant information
         # should be removed from the serialized data to reduce the size of the serialized data.
-        cls_ser = None
-        if iod.uuid in node._class_io_serialized:
-            cls_ser = node._class_io_serialized[iod.uuid]
-
-        if cls_ser:
-            if "description" in ioser:
-                if ioser["description"] == cls_ser.get("description", ""):
-                    del ioser["description"]
-
-            if "default" in ioser:
-                if ioser["default"] == cls_ser.get("default", NoValue):
-                    del ioser["default"]
-
-            if "type" in ioser:
-                if ioser["type"] == cls_ser.get("type", "Any"):
-                    del ioser["type"]
-
-            if "value_options" in ioser:
-                if ioser["value_options"] == cls_ser.get("value_options", {}):
-                    del ioser["value_options"]
-
-            if "render_options" in ioser:
-                if ioser["render_options"] == cls_ser.get("render_options", {}):
-                    del ioser["render_options"]
+        _drop_class_io_defaults(node, iod.uuid, ioser)
 
         ser["io"][iod.uuid] = ioser
 
@@ -1,293 +1,228 @@
 import unittest
 import funcnodes_core as fn
 from typing import Tuple
+from contextlib import contextmanager
 import sys
-
-if not sys.warnoptions:
-    import warnings
-
-    warnings.simplefilter("error", DeprecationWarning)
+import warnings
 
 
 fn.config.IN_NODE_TEST = True
 
 
-class TestDecorator(unittest.IsolatedAsyncioTestCase):
-    async def test_update_value_options_decorator(self):
-        @fn.NodeDecorator(
-            "test_decorator_update_value",
-            description="Test decorator for updating value.",
-            default_io_options={
-                "obj": {
-                    "on": {
-                        "after_set_value": fn.decorator.update_other_io_options(
-                            "key", lambda x: list(x.keys())
-                        )
-                    }
-                }
-            },
-        )
-        def select(obj: dict, key: str):
-            return obj[key]
-
-        node = select()
-
-        self.assertEqual(
-            len(node.inputs),
-            3,
-            f"Node should have 3 inputs: obj,key and _triggerinput, but has {node.inputs.keys()}.",
-        )
-
-        node["obj"] = {"key1": "value1", "key2": "value2"}
-        await node
-
-        self.assertTrue(
-            hasattr(node["key"], "value_options"),
-            "Node-key has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key"].value_options,
-            "Node-key has no value_options.options attribute.",
-        )
-        self.assertEqual(node["key"].value_options["options"], ["key1", "key2"])
-
-    async def test_node_input_param(self):
-        called_node = []
+@contextmanager
+def strict_deprecations():
+    """Turns DeprecationWarnings into errors, without changing the filters of other test modules."""
+    with warnings.catch_warnings():
+        if not sys.warnoptions:
+            warnings.simplefilter("error", DeprecationWarning)
+        yield
 
-        @fn.NodeDecorator(
-            "test_node_input_param",
-            description="Test decorator for node param",
-        )
-        def select(a: int, node: fn.Node) -> int:
-            called_node.append(node)
-            return a + 1
 
-        node = select()
+OBJ = {"key1": "value1", "key2": "value2"}
 
-        self.assertEqual(
-            len(node.inputs),
-            2,
-            f"Node should have 3 inputs: a and _triggerinput, but has {node.inputs.keys()}.",
-        )
+called_nodes = []
 
-        node["a"] = 1
+with strict_deprecations():
 
-        await node
-
-        self.assertEqual(node.outputs["out"].value, 2)
-        self.assertEqual(len(called_node), 1)
-        self.assertEqual(called_node[0], node)
-
-    async def test_update_multiple_value_options_decorator(self):
-        @fn.NodeDecorator(
-            "test_update_multiple_value_decorator",
-            description="Test decorator for updating value.",
-            default_io_options={
-                "obj": {
-                    "on": {
-                        "after_set_value": [
-                            fn.decorator.update_other_io_options(
-                                "key1", lambda x: list(x.keys())
-                            ),
-                            fn.decorator.update_other_io_options(
-                                "key2", lambda x: list(x.keys()) + list(x.keys())
-                            ),
-                        ],
-                    }
+    @fn.NodeDecorator(
+        "test_decorator_update_value",
+        description="Test decorator for updating value.",
+        default_io_options={
+            "obj": {
+                "on": {
+                    "after_set_value": fn.decorator.update_other_io_options(
+                        "key", lambda x: list(x.keys())
+                    )
                 }
-            },
-        )
-        def select(obj: dict, key1: str, key2: str) -> Tuple[str, str]:
-            return obj[key1], obj[key2]
-
-        node = select()
-        node["obj"] = {"key1": "value1", "key2": "value2"}
-        await node
-
-        self.assertTrue(
-            hasattr(node["key1"], "value_options"),
-            "Node-key1 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key1"].value_options,
-            "Node-key1 has no value_options.options attribute.",
-        )
-        self.assertEqual(node["key1"].value_options["options"], ["key1", "key2"])
-
-        self.assertTrue(
-            hasattr(node["key2"], "value_options"),
-            "Node-key2 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key2"].value_options,
-            "Node-key2 has no value_options.options attribute.",
-        )
-
-        self.assertEqual(
-            node["key2"].value_options["options"], ["key1", "key2", "key1", "key2"]
-        )
-
-    async def test_update_multiple_value_options_with_one_decorator(self):
-        @fn.NodeDecorator(
-            "test_update_multiple_value_with_one_decorator",
-            description="Test decorator for updating value.",
-            default_io_options={
-                "obj": {
-                    "on": {
-                        "after_set_value": fn.decorator.update_other_io_options(
-                            ["key1", "key2"], lambda x: list(x.keys())
+            }
+        },
+    )
+    def select_update_options(obj: dict, key: str):
+        return obj[key]
+
+    @fn.NodeDecorator(
+        "test_node_input_param",
+        description="Test decorator for node param",
+    )
+    def select_node_input_param(a: int, node: fn.Node) -> int:
+        called_nodes.append(node)
+        return a + 1
+
+    @fn.NodeDecorator(
+        "test_update_multiple_value_decorator",
+        description="Test decorator for updating value.",
+        default_io_options={
+            "obj": {
+                "on": {
+                    "after_set_value": [
+                        fn.decorator.update_other_io_options(
+                            "key1", lambda x: list(x.keys())
+                        ),
+                        fn.decorator.update_other_io_options(
+                            "key2", lambda x: list(x.keys()) + list(x.keys())
                         ),
-                    }
+                    ],
                 }
-            },
-        )
-        def select(obj: dict, key1: str, key2: str) -> Tuple[str, str]:
-            return obj[key1], obj[key2]
-
-        node = select()
-        node["obj"] = {"key1": "value1", "key2": "value2"}
-        await node
-
-        self.assertTrue(
-            hasattr(node["key1"], "value_options"),
-            "Node-key1 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key1"].value_options,
-            "Node-key1 has no value_options.options attribute.",
-        )
-        self.assertEqual(node["key1"].value_options["options"], ["key1", "key2"])
-
-        self.assertTrue(
-            hasattr(node["key2"], "value_options"),
-            "Node-key2 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key2"].value_options,
-            "Node-key2 has no value_options.options attribute.",
-        )
+            }
+        },
+    )
+    def select_update_multiple_options(
+        obj: dict, key1: str, key2: str
+    ) -> Tuple[str, str]:
+        return obj[key1], obj[key2]
+
+    @fn.NodeDecorator(
+        "test_update_multiple_value_with_one_decorator",
+        description="Test decorator for updating value.",
+        default_io_options={
+            "obj": {
+                "on": {
+                    "after_set_value": fn.decorator.update_other_io_options(
+                        ["key1", "key2"], lambda x: list(x.keys())
+                    ),
+                }
+            }
+        },
+    )
+    def select_update_multiple_options_with_one(
+        obj: dict, key1: str, key2: str
+    ) -> Tuple[str, str]:
+        return obj[key1], obj[key2]
+
+    @fn.NodeDecorator(
+        "test_decorator_update_value_options",
+        description="Test decorator for updating value.",
+        default_io_options={
+            "obj": {
+                "on": {
+                    "after_set_value": fn.decorator.update_other_io_value_options(
+                        "key", lambda x: {"options": list(x.keys())}
+                    )
+                }
+            }
+        },
+    )
+    def select_update_value_options(obj: dict, key: str):
+        return obj[key]
+
+    @fn.NodeDecorator(
+        "test_update_multiple_value_options_decorator",
+        description="Test decorator for updating value.",
+        default_io_options={
+            "obj": {
+                "on": {
+                    "after_set_value": [
+                        fn.decorator.update_other_io_value_options(
+                            "key1", lambda x: {"options": list(x.keys())}
+                        ),
+                        fn.decorator.update_other_io_value_options(
+                            "key2",
+                            lambda x: {"options": list(x.keys()) + list(x.keys())},
+                        ),
+                    ],
+                }
+            }
+        },
+    )
+    def select_update_multiple_value_options(
+        obj: dict, key1: str, key2: str
+    ) -> Tuple[str, str]:
+        return obj[key1], obj[key2]
+
+    @fn.NodeDecorator(
+        "test_update_multiple_value_options_with_one_decorator",
+        description="Test decorator for updating value.",
+        default_io_options={
+            "obj": {
+                "on": {
+                    "after_set_value": fn.decorator.update_other_io_value_options(
+                        ["key1", "key2"], lambda x: {"options": list(x.keys())}
+                    ),
+                }
+            }
+        },
+    )
+    def select_update_multiple_value_options_with_one(
+        obj: dict, key1: str, key2: str
+    ) -> Tuple[str, str]:
+        return obj[key1], obj[key2]
+
+
+UPDATE_OPTION_CASES = [
+    (select_update_options, {"key": ["key1", "key2"]}),
+    (
+        select_update_multiple_options,
+        {"key1": ["key1", "key2"], "key2": ["key1", "key2", "key1", "key2"]},
+    ),
+    (
+        select_update_multiple_options_with_one,
+        {"key1": ["key1", "key2"], "key2": ["key1", "key2"]},
+    ),
+    (select_update_value_options, {"key": ["key1", "key2"]}),
+    (
+        select_update_multiple_value_options,
+        {"key1": ["key1", "key2"], "key2": ["key1", "key2", "key1", "key2"]},
+    ),
+    (
+        select_update_multiple_value_options_with_one,
+        {"key1": ["key1", "key2"], "key2": ["key1", "key2"]},
+    ),
+]
 
-        self.assertEqual(node["key2"].value_options["options"], ["key1", "key2"])
 
-    async def test_update_other_io_value_options(self):
-        @fn.NodeDecorator(
-            "test_decorator_update_value",
-            description="Test decorator for updating value.",
-            default_io_options={
-                "obj": {
-                    "on": {
-                        "after_set_value": fn.decorator.update_other_io_value_options(
-                            "key", lambda x: {"options": list(x.keys())}
-                        )
-                    }
-                }
-            },
-        )
-        def select(obj: dict, key: str):
-            return obj[key]
+class TestDecorator(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.enterClassContext(strict_deprecations())
 
-        node = select()
-        node["obj"] = {"key1": "value1", "key2": "value2"}
-        await node
+    @unittest.skipIf(sys.warnoptions, "warning filters set from the command line")
+    def test_deprecations_are_errors(self):
+        with self.assertRaises(DeprecationWarning):
+            warnings.warn("deprecated", DeprecationWarning)
 
+    def assert_options(self, node: fn.Node, io: str, expected: list):
         self.assertTrue(
-            hasattr(node["key"], "value_options"),
-            "Node-key has no value_options attribute.",
+            hasattr(node[io], "value_options"),
+            f"Node-{io} has no value_options attribute.",
         )
         self.assertTrue(
-            "options" in node["key"].value_options,
-            "Node-key has no value_options.options attribute.",
+            "options" in node[io].value_options,
+            f"Node-{io} has no value_options.options attribute.",
         )
-        self.assertEqual(node["key"].value_options["options"], ["key1", "key2"])
+        self.assertEqual(node[io].value_options["options"], expected)
 
-    async def test_update_other_io_value_options_multiple_calls(self):
-        @fn.NodeDecorator(
-            "test_update_multiple_value_decorator",
-            description="Test decorator for updating value.",
-            default_io_options={
-                "obj": {
-                    "on": {
-                        "after_set_value": [
-                            fn.decorator.update_other_io_value_options(
-                                "key1", lambda x: {"options": list(x.keys())}
-                            ),
-                            fn.decorator.update_other_io_value_options(
-                                "key2",
-                                lambda x: {"options": list(x.keys()) + list(x.keys())},
-                            ),
-                        ],
-                    }
-                }
-            },
-        )
-        def select(obj: dict, key1: str, key2: str) -> Tuple[str, str]:
-            return obj[key1], obj[key2]
+    def test_update_io_options(self):
+        for nodeclass, expected in UPDATE_OPTION_CASES:
+            with self.subTest(node_id=nodeclass.node_id):
+                node = nodeclass()
+                self.assertEqual(
+                    len(node.inputs),
+                    len(expected) + 2,
+                    f"Node should have the inputs obj, {', '.join(expected)} and _triggerinput, "
+                    f"but has {node.inputs.keys()}.",
+                )
 
-        node = select()
-        node["obj"] = {"key1": "value1", "key2": "value2"}
-        await node
+                # the options are updated synchronously by the after_set_value listeners,
+                # so the node does not need to be triggered
+                node.inputs["obj"].set_value(OBJ, does_trigger=False)
 
-        self.assertTrue(
-            hasattr(node["key1"], "value_options"),
-            "Node-key1 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key1"].value_options,
-            "Node-key1 has no value_options.options attribute.",
-        )
-        self.assertEqual(node["key1"].value_options["options"], ["key1", "key2"])
+                for io, options in expected.items():
+                    self.assert_options(node, io, options)
 
-        self.assertTrue(
-            hasattr(node["key2"], "value_options"),
-            "Node-key2 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key2"].value_options,
-            "Node-key2 has no value_options.options attribute.",
-        )
+    async def test_node_input_param(self):
+        called_nodes.clear()
+        node = select_node_input_param()
 
         self.assertEqual(
-            node["key2"].value_options["options"], ["key1", "key2", "key1", "key2"]
+            len(node.inputs),
+            2,
+            f"Node should have 3 inputs: a and _triggerinput, but has {node.inputs.keys()}.",
         )
 
-    async def test_update_other_io_value_options_multiple_multipleios(self):
-        @fn.NodeDecorator(
-            "test_update_multiple_value_with_one_decorator",
-            description="Test decorator for updating value.",
-            default_io_options={
-                "obj": {
-                    "on": {
-                        "after_set_value": fn.decorator.update_other_io_value_options(
-                            ["key1", "key2"], lambda x: {"options": list(x.keys())}
-                        ),
-                    }
-                }
-            },
-        )
-        def select(obj: dict, key1: str, key2: str) -> Tuple[str, str]:
-            return obj[key1], obj[key2]
+        node["a"] = 1
 
-        node = select()
-        node["obj"] = {"key1": "value1", "key2": "value2"}
         await node
 
-        self.assertTrue(
-            hasattr(node["key1"], "value_options"),
-            "Node-key1 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key1"].value_options,
-            "Node-key1 has no value_options.options attribute.",
-        )
-        self.assertEqual(node["key1"].value_options["options"], ["key1", "key2"])
-
-        self.assertTrue(
-            hasattr(node["key2"], "value_options"),
-            "Node-key2 has no value_options attribute.",
-        )
-        self.assertTrue(
-            "options" in node["key2"].value_options,
-            "Node-key2 has no value_options.options attribute.",
-        )
-
-        self.assertEqual(node["key2"].value_options["options"], ["key1", "key2"])
+        self.assertEqual(node.outputs["out"].value, 2)
+        self.assertEqual(len(called_nodes), 1)
+        self.assertEqual(called_nodes[0], node)
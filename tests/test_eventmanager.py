@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import unittest
 from unittest.mock import MagicMock
 from funcnodes_core.eventmanager import (
@@ -371,6 +372,36 @@ class TestEventEmitterMixin(unittest.TestCase):
         result = self.emitter.emit("test_event", MessageInArgs(src=self.emitter))
         self.assertFalse(result)
 
+    def test_emit_without_message_and_listeners_returns_false(self):
+        self.emitter.on("other_event", MagicMock())
+        self.assertFalse(self.emitter.emit("test_event"))
+
+    def test_emit_mass_listeners_with_once(self):
+        """Listeners removed or added during an emit do not affect the running emit."""
+        calls = []
+        listeners = [(lambda i=i, **kwargs: calls.append(i)) for i in range(10_000)]
+        for listener in listeners[:5_000]:
+            self.emitter.on("test_event", listener)
+        once_listener = MagicMock()
+        self.emitter.once("test_event", once_listener)
+        for listener in listeners[5_000:]:
+            self.emitter.on("test_event", listener)
+        late_listener = MagicMock()
+        self.emitter.on(
+            "test_event", lambda **kwargs: self.emitter.on("test_event", late_listener)
+        )
+
+        self.emitter.emit("test_event")
+        self.assertEqual(calls, list(range(10_000)))
+        once_listener.assert_called_once()
+        late_listener.assert_not_called()
+
+        calls.clear()
+        self.emitter.emit("test_event")
+        self.assertEqual(calls, list(range(10_000)))
+        once_listener.assert_called_once()
+        late_listener.assert_called_once()
+
     def test_error_raises_if_no_listeners(self):
         """Should raise the exception if no error listeners are registered."""
         with self.assertRaises(Exception) as context:
@@ -452,6 +483,27 @@ class TestEventEmitterMixin(unittest.TestCase):
         emitter.test_event2.assert_called_with(src=emitter, error=exc)
 
 
+class TestEventEmitterMixinDeletion(unittest.TestCase):
+    """Unit tests for the cleanup of EventEmitterMixin subclasses upon deletion."""
+
+    def test_subclass_cleanup_on_delete(self):
+        """Subclasses are cleaned up and release their listeners when deleted."""
+        cleaned = []
+
+        class Resource(EventEmitterMixin):
+            def cleanup(self):
+                cleaned.append(self._events)
+                super().cleanup()
+
+        emitter = Resource()
+        emitter.on("test_event", MagicMock())
+        del emitter
+        gc.collect()
+
+        self.assertEqual(len(cleaned), 1)
+        self.assertEqual(cleaned[0], {})
+
+
 class TestDecorators(unittest.TestCase):
     """Unit tests for the emit_before and emit_after decorator factories."""
 
@@ -10,6 +10,7 @@ from funcnodes_core.lib import (
     Shelf,
     Library,
     ShelfReferenceLost,
+    NodeClassNotFoundError,
 )
 import gc
 
@@ -137,3 +138,13 @@ class TestLib(unittest.TestCase):
         self.assertEqual(lib.shelves[0].subshelves, [])
         self.assertEqual(s, lib.shelves[0])
         self.assertEqual(s2, s)
+
+    def test_lib_get_node_by_id(self):
+        lib = Library()
+        lib.add_node(testfunc, ["parent", "child"])
+        self.assertTrue(lib.has_node_id(testfunc.node_id))
+        self.assertIs(lib.get_node_by_id(testfunc.node_id), testfunc)
+
+        self.assertFalse(lib.has_node_id("unknown"))
+        with self.assertRaises(NodeClassNotFoundError):
+            lib.get_node_by_id("unknown")
@@ -1,6 +1,10 @@
 import unittest
 from funcnodes_core import NodeSpace, Node, NodeInput, NodeOutput, Shelf
 import gc
+import weakref
+import json
+import traceback
+from funcnodes_core.utils.serialization import JSONEncoder
 
 
 class DummyNode(Node):
@@ -51,6 +55,12 @@ class TestNodeSpace(unittest.IsolatedAsyncioTestCase):
         self.nodespace.add_node_instance(node)
         self.assertIn(node, self.nodespace.nodes)
 
+        with self.assertRaises(ValueError):
+            self.nodespace.add_node_instance(node)
+        with self.assertRaises(ValueError):
+            self.nodespace.add_node_instance(DummyNode(uuid=node.uuid))
+        self.assertEqual(self.nodespace.nodes, [node])
+
     def test_add_node_by_id(self):
         node_id = "ns_dummy_node"
         nodeuuid = self.nodespace.add_node_by_id(node_id).uuid
@@ -63,6 +73,9 @@ class TestNodeSpace(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(nodeuuid, node.uuid)
         self.assertEqual(node_id, node.node_id)
 
+        with self.assertRaises(ValueError):
+            self.nodespace.get_node_by_id("unknown")
+
     def test_serialize_nodes(self):
         node = DummyNode()
         self.nodespace.add_node_instance(node)
@@ -86,6 +99,23 @@ class TestNodeSpace(unittest.IsolatedAsyncioTestCase):
         self.assertIn("edges", serialized_nodespace)
         self.assertIn("prop", serialized_nodespace)
 
+    def test_full_serialize_bytes(self):
+        node1 = DummyNode()
+        node2 = DummyNode()
+        node1["output"].connect(node2["input"])
+        self.nodespace.add_node_instance(node1)
+        self.nodespace.add_node_instance(node2)
+        self.nodespace.set_property("a", [1, 2])
+
+        self.assertEqual(
+            json.loads(self.nodespace.full_serialize_bytes(with_io_values=True)),
+            json.loads(
+                json.dumps(
+                    self.nodespace.full_serialize(with_io_values=True), cls=JSONEncoder
+                )
+            ),
+        )
+
     def test_deserialize(self):
         node = DummyNode()
         self.nodespace.add_node_instance(node)
@@ -94,6 +124,33 @@ class TestNodeSpace(unittest.IsolatedAsyncioTestCase):
         self.nodespace.deserialize(serialized_nodespace)
         self.assertEqual(len(self.nodespace.nodes), 1)
 
+    def test_serialization_restores_gc(self):
+        self.nodespace.add_node_instance(DummyNode())
+        self.assertTrue(gc.isenabled())
+        self.nodespace.deserialize(self.nodespace.serialize())
+        self.assertTrue(gc.isenabled())
+
+        with self.assertRaises(KeyError):
+            self.nodespace.deserialize_nodes([{}])
+        self.assertTrue(gc.isenabled())
+
+        gc.disable()
+        try:
+            self.nodespace.serialize_nodes()
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
+
+    def test_deserialize_empty(self):
+        self.nodespace.add_node_instance(DummyNode())
+        self.nodespace.set_property("a", 1)
+
+        self.nodespace.deserialize({"prop": {"b": 2}})
+        self.assertEqual(self.nodespace.nodes, [])
+        self.assertEqual(self.nodespace.edges, [])
+        self.assertIsNone(self.nodespace.get_property("a"))
+        self.assertEqual(self.nodespace.get_property("b"), 2)
+
     def test_serialize_forward(self):
         node1 = DummyNode()
         node2 = DummyNode()
@@ -106,6 +163,101 @@ class TestNodeSpace(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(len(serialized_nodespace["edges"]), 2)
 
+    def test_deserialize_edges_skips_invalid(self):
+        node1 = DummyNode()
+        node2 = DummyNode()
+        self.nodespace.add_node_instance(node1)
+        self.nodespace.add_node_instance(node2)
+        self.nodespace.deserialize_edges(
+            [
+                ("unknown", "output", node2.uuid, "input"),
+                (node1.uuid, "output", None, "input"),
+                (node1.uuid, "unknown", node2.uuid, "input"),
+                (node1.uuid, "output", node2.uuid, "input"),
+            ]
+        )
+        self.assertEqual(self.nodespace.edges, [(node1["output"], node2["input"])])
+
+    def test_clear(self):
+        node1 = DummyNode()
+        node2 = DummyNode()
+        node1["output"].connect(node2["input"])
+        self.nodespace.add_node_instance(node1)
+        self.nodespace.add_node_instance(node2)
+        self.nodespace.set_property("a", 1)
+
+        self.nodespace.clear()
+        self.assertEqual(self.nodespace.nodes, [])
+        self.assertEqual(self.nodespace.edges, [])
+        self.assertIsNone(self.nodespace.get_property("a"))
+
+    def test_node_events(self):
+        node = DummyNode()
+        self.nodespace.add_node_instance(node)
+        events = []
+        self.nodespace.on("*", lambda event, **msg: events.append(event))
+
+        node.emit("custom_event")
+        self.assertEqual(events, ["custom_event"])
+
+        node.cleanup()
+        self.assertEqual(self.nodespace.nodes, [])
+        self.assertNotIn("cleanup", events)
+        self.assertIn("node_removed", events)
+
+    def test_node_error_traceback(self):
+        node = DummyNode()
+        self.nodespace.add_node_instance(node)
+        messages = []
+        self.nodespace.on("node_error", lambda **msg: messages.append(msg))
+        try:
+            raise ValueError("test error")
+        except ValueError as e:
+            error = e
+        self.nodespace.on_node_error(node, error)
+
+        self.assertEqual(len(messages), 1)
+        tb = messages[0]["tb"]
+        # the traceback is relayed as a plain list of the formatted lines
+        self.assertIsInstance(tb, list)
+        self.assertEqual(tb, traceback.format_exception(error))
+        self.assertEqual(json.loads(json.dumps(tb)), tb)
+
+    def test_set_property(self):
+        self.nodespace.set_property("a", 1)
+        self.nodespace.set_property("b", {"c": [1, 2.5, "d", None]})
+        self.assertEqual(self.nodespace.get_property("a"), 1)
+        self.assertEqual(self.nodespace.get_property("b"), {"c": [1, 2.5, "d", None]})
+
+        with self.assertRaises(ValueError):
+            self.nodespace.set_property("e", {"f": object()})
+        with self.assertRaises(ValueError):
+            self.nodespace.set_property(1, "g")
+
+        value = {"h": object()}
+        self.nodespace.set_property("h", value, validate=False)
+        self.assertIs(self.nodespace.get_property("h"), value)
+
+    def test_edges_follow_connection_changes(self):
+        node1 = DummyNode()
+        node2 = DummyNode()
+        node3 = DummyNode()
+        self.nodespace.add_node_instance(node1)
+        self.nodespace.add_node_instance(node2)
+        self.assertEqual(self.nodespace.edges, [])
+
+        node1["output"].connect(node2["input"])
+        self.assertEqual(self.nodespace.edges, [(node1["output"], node2["input"])])
+
+        node2["input"].connect(node3["input"])
+        self.assertEqual(len(self.nodespace.edges), 2)
+
+        node1["output"].disconnect(node2["input"])
+        self.assertEqual(self.nodespace.edges, [(node2["input"], node3["input"])])
+
+        self.nodespace.remove_node_instance(node2)
+        self.assertEqual(self.nodespace.edges, [])
+
     def test_deserialize_forward(self):
         node1 = DummyNode()
         node2 = DummyNode()
@@ -136,6 +288,41 @@ class TestNodeSpace(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(node3["input"].value, 123)
 
+    def test_remove_node_disconnects_nodespace_nodes(self):
+        node1 = DummyNode()
+        node2 = DummyNode()
+        external = DummyNode()
+        node1["output"].connect(node2["input"])
+        external["output"].connect(node1["input"])
+        self.nodespace.add_node_instance(node1)
+        self.nodespace.add_node_instance(node2)
+
+        node1_input = node1["input"]
+        self.nodespace.remove_node_instance(node1)
+        self.assertEqual(node2["input"].connections, [])
+        self.assertEqual(external["output"].connections, [node1_input])
+
+        with self.assertRaises(ValueError):
+            self.nodespace.remove_node_instance(node1)
+
+    def test_removed_node_freed_without_gc(self):
+        # removing a node cleans it up, which detaches its io listeners and connections,
+        # so the removed node is freed by reference counting alone
+        node = DummyNode()
+        other = DummyNode()
+        node["output"].connect(other["input"])
+        self.nodespace.add_node_instance(node)
+        self.nodespace.add_node_instance(other)
+        ref = weakref.ref(node)
+        gc.disable()
+        try:
+            self.nodespace.remove_node_instance(node)
+            del node
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+        self.assertEqual(self.nodespace.nodes, [other])
+
     def test_remove_node(self):
         gc.collect()
         # gc.set_debug(gc.DEBUG_LEAK)
@@ -165,8 +352,8 @@ class TestNodeSpace(unittest.IsolatedAsyncioTestCase):
 
         # gollect garbage before node is deleted
         gc.collect()
-        # delete node
-        node1.__del__()
+        # cleanup node
+        node1.cleanup()
 
         # make sure node has no references
         self.assertEqual(len(gc.get_referrers(node1)), 0, gc.get_referrers(node1))
@@ -1,4 +1,5 @@
 import unittest
+import sys
 
 from funcnodes_core.utils.nodeutils import (
     get_deep_connected_nodeset,
@@ -45,6 +46,16 @@ class TestNodeUtils(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn(self.node2, nodeset)
         self.assertNotIn(self.node3, nodeset)
 
+    async def test_get_deep_connected_nodeset_deep_chain(self):
+        # chains deeper than the recursion limit are collected as well
+        nodes = [self.node3]
+        for _ in range(sys.getrecursionlimit()):
+            node = identity()
+            nodes[-1].outputs["out"].connect(node.inputs["input"])
+            nodes.append(node)
+        nodeset = get_deep_connected_nodeset(self.node1)
+        self.assertEqual(nodeset, {self.node1, self.node2, *nodes})
+
     async def test_run_until_complete_all_triggered(self):
         # Run the function until all nodes are no longer triggering.
         await run_until_complete(self.node1, self.node2, self.node3)
@@ -1,4 +1,5 @@
 import asyncio
+import contextvars
 import unittest
 from funcnodes_core.triggerstack import TriggerStack  # Replace with your actual import
 from funcnodes_core import NodeDecorator, config, NodeTriggerError
@@ -158,5 +159,49 @@ class TestTriggerStack(unittest.IsolatedAsyncioTestCase):
             await ins
 
 
+class TestNodeTriggerTask(unittest.IsolatedAsyncioTestCase):
+    async def test_trigger_context_isolated(self):
+        var = contextvars.ContextVar("test_trigger_context_var", default="unset")
+        seen = []
+
+        @NodeDecorator("test_trigger_context_isolated")
+        async def read_and_leak(value: str) -> str:
+            seen.append(var.get())
+            var.set("leaked")
+            return value
+
+        node = read_and_leak()
+        var.set("first")
+        node["value"] = "a"
+        await node
+        var.set("second")
+        node["value"] = "b"
+        await node
+
+        self.assertEqual(seen[-2:], ["first", "second"])
+        self.assertEqual(var.get(), "second")
+
+    async def test_trigger_cancel(self):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        @NodeDecorator("test_trigger_cancel")
+        async def wait_forever() -> int:
+            started.set()
+            try:
+                await asyncio.sleep(100)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return 1
+
+        node = wait_forever()
+        await started.wait()
+        task = node.triggerstack[0]
+        self.assertIsInstance(task, asyncio.Task)
+        task.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ import logging
 from io import StringIO
 
 from funcnodes_core import get_logger, set_log_format
+from funcnodes_core._logging import NotTooLongStringFormatter
 
 
 class TestNotTooLongStringFormatter(unittest.TestCase):
@@ -30,6 +31,18 @@ class TestNotTooLongStringFormatter(unittest.TestCase):
 
         self.assertEqual(output, "Short message.")
 
+    def test_no_truncate_max_length_message(self):
+        self.logger.info("x" * 20)
+        output = self.stream.getvalue().strip()
+
+        self.assertEqual(output, "x" * 20)
+
+    def test_max_length_from_string(self):
+        formatter = NotTooLongStringFormatter(max_length="10")
+        record = logging.makeLogRecord({"msg": "a message longer than ten"})
+
+        self.assertEqual(formatter.format(record), "a messa...")
+
     def test_no_truncate_exception(self):
         try:
             raise ValueError("An example exception with a lot of text.")